@@ -18,6 +18,12 @@ def n_common_words_validation(n_common_words: int):
     return n_common_words
 
 
+def max_workers_validation(max_workers: int | None):
+    if max_workers is not None and max_workers < 1:
+        raise typer.BadParameter(f"The max workers value of {max_workers} must be greater than 0.")
+    return max_workers
+
+
 def max_sentence_column_width_validation(column_width: int):
     if column_width < 40:
         raise typer.BadParameter(f"The given maximum sentence column width of {column_width} must be greater than 39.")
@@ -42,10 +48,27 @@ def main(
             help="Use to specify the maximum sentence column width.",
             show_default=False,
             callback=max_sentence_column_width_validation
+        ),
+        max_workers: int = typer.Option(
+            None,
+            help="Use to specify the maximum number of worker processes used to process documents.",
+            show_default=False,
+            callback=max_workers_validation
+        ),
+        fast_sentences: bool = typer.Option(
+            False,
+            help="Use to segment sentences with a lightweight regex splitter instead of Punkt; "
+                 "faster, but only suitable for well-formed prose.",
+            show_default=False
+        ),
+        cache: bool = typer.Option(
+            True,
+            help="Use to persist tokenized metrics on disk so unchanged documents "
+                 "are not re-tokenized on later invocations."
         )
 ):
     control = EigenController()
-    control.run(word_length_interval, n_common_words, max_sentence_column_width)
+    control.run(word_length_interval, n_common_words, max_sentence_column_width, max_workers, fast_sentences, cache)
 
 
 if __name__ == "__main__":
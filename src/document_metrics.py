@@ -1,26 +1,85 @@
+import hashlib
+import heapq
 import os
-from collections import Counter, defaultdict
-from functools import reduce
-from operator import add
+import pickle
+import re
+from array import array
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Set, List, Dict, Tuple
+from typing import AbstractSet, Callable, List, Dict, Tuple, Iterator
 import nltk
 
+try:
+    import regex as _regex
+except ImportError:
+    _regex = None
+
+
+_fast_sentence_boundary = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+
+def fast_sentence_split(text: str) -> List[str]:
+    """
+    Split text into sentences with a single compiled boundary regex. Much
+    faster than the Punkt tokenizer and a close match for it on well-formed
+    English prose, but it does not handle abbreviations or unusual casing;
+    use it when the inputs are known to be clean.
+    :param text: The text to segment
+    :return: A list of sentences as strings
+    """
+    text = text.strip()
+    if not text:
+        return []
+    return _fast_sentence_boundary.split(text)
+
+
+_sentence_tokenizer = None
+
+
+def _punkt_sentence_tokenizer():
+    """
+    Load the Punkt sentence tokenizer once per process. nltk.sent_tokenize
+    re-dispatches through nltk.data.load on every call, which shows up in
+    profiles when many small documents are segmented. Loading lazily keeps
+    importing this module from requiring the NLTK data to be installed.
+    :return: The Punkt tokenizer for English
+    """
+    global _sentence_tokenizer
+    if _sentence_tokenizer is None:
+        _sentence_tokenizer = nltk.data.load('tokenizers/punkt/english.pickle')
+    return _sentence_tokenizer
+
+
+def _compile_token_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a verbose token pattern with the third-party regex module when it
+    is available, since its matcher is faster on alternation-heavy patterns,
+    and fall back to the stdlib re module otherwise.
+    :param pattern: A verbose regular expression as a string
+    :return: The compiled pattern
+    """
+    if _regex is not None:
+        return _regex.compile(pattern, _regex.VERBOSE)
+    return re.compile(pattern, re.VERBOSE)
+
 
 class TokenPattern:
-    t0 = r'''(?x)                    # set flag to allow verbose regexps
+    t0 = _compile_token_pattern(r'''
              (?:[A-Z]\.)+            # abbreviations, e.g. U.S.A.
              | \w+(?:['-]\w+)*       # words with optional internal hyphens or apostrophes (word contractions)
              | \$?\d+(?:[\.,]\d+)?%? # currency and percentages, e.g. $12.40, 82%
-             '''
+             ''')
 
-    t1 = r'''(?x)                    # set flag to allow verbose regexps
+    t1 = _compile_token_pattern(r'''
              (?:[A-Z]\.)+            # abbreviations, e.g. U.S.A.
              | \w+(?:-\w+)*          # words with optional internal hyphens
              | \$?\d+(?:[\.,]\d+)?%? # currency and percentages, e.g. $12.40, 82%
              | \.\.\.                # ellipsis
              | [][.,;"'?():-_`]      # these are separate tokens; includes ], [
-             '''
+             ''')
 
 
 class Document:
@@ -30,21 +89,39 @@ class Document:
         :param document_path: A file path
         """
         self._document_path = document_path
+        self._name: str | None = None
+        self._text: str | None = None
+
+    @classmethod
+    def from_text(cls, name: str, text: str) -> 'Document':
+        """
+        Model a document from text already held in memory, bypassing the
+        filesystem entirely.
+        :param name: The name this document reports
+        :param text: The full document text
+        :return: A Document backed by the given text
+        """
+        document = cls(None)
+        document._name = name
+        document._text = text
+        return document
 
     def read(self) -> str:
         """
         Read contents of the entire current document
         :return: document as string
         """
-        with open(self._document_path, 'rt') as doc:
-            raw = doc.read()
-        return raw
+        if self._text is not None:
+            return self._text
+        return Path(self._document_path).read_text(encoding='utf-8')
 
     def exists(self) -> bool:
         """
         Check if document exists at the current path
         :return: True if document exists
         """
+        if self._text is not None:
+            return True
         return os.path.exists(self._document_path)
 
     def name(self) -> str:
@@ -52,27 +129,62 @@ class Document:
         The name of the file defined by the document path
         :return: string name of this document
         """
+        if self._name is not None:
+            return self._name
         return Path(self._document_path).name
 
+    def path(self) -> Path | None:
+        """
+        The file path that defines this document
+        :return: the path of this document, or None for in-memory documents
+        """
+        if self._document_path is None:
+            return None
+        return Path(self._document_path)
+
 
 class DocumentMetrics:
-    def __init__(self, doc: 'Document', token_pattern: str = TokenPattern.t0):
+    def __init__(
+            self,
+            doc: 'Document',
+            token_pattern: re.Pattern = TokenPattern.t0,
+            streaming: bool = False,
+            sentence_splitter: Callable[[str], List[str]] | None = None,
+            cache_dir: Path | None = None
+    ):
         """
         Model that defines the metrics of a given Document
         :param doc: The object that models a text file.
-        :param token_pattern: A text pattern that defines words of interest.
+        :param token_pattern: A compiled text pattern that defines words of interest.
+        :param sentence_splitter: A callable that segments text into
+                                  sentences; defaults to the Punkt tokenizer.
+                                  Pass fast_sentence_split for clean prose
+                                  where Punkt accuracy is not needed.
+        :param streaming: If True the segmented sentence words are consumed
+                          sentence by sentence and never retained; only the
+                          word frequencies and the word to sentence index are
+                          kept, which lowers peak memory on large documents.
+                          The word list properties are then rebuilt on every
+                          access instead of being cached.
+        :param cache_dir: If given, computed metrics are persisted there
+                          keyed by document path, modification time and
+                          token pattern, and reloaded on later runs instead
+                          of re-tokenizing the document.
         """
         self._doc = doc
         self._token_pattern = token_pattern
+        self._streaming = streaming
+        self._sentence_splitter = sentence_splitter
+        self._cache_dir = cache_dir
+        self._lower_cache: Dict[str, str] = {}
 
         self._sentences: List[str] | None = None
         self._sentence_words: List[List[str]] | None = None
-        self._word_sentences_map: Dict[str, List[int]] | None = None
+        self._word_sentences_map: Dict[str, array] | None = None
         self._words: List[str] | None = None
         self._words_normalized: List[str] | None = None
         self._word_frequencies: Counter | None = None
-        self._vocabulary: Set[str] | None = None
-        self._vocabulary_normalized: Set[str] | None = None
+        self._raw_word_frequencies: Counter | None = None
 
     @property
     def document_name(self) -> str:
@@ -85,11 +197,14 @@ class DocumentMetrics:
         :return: A list of sentences as strings
         """
         if self._sentences is None:
-            self._sentences = nltk.sent_tokenize(self._doc.read())
+            if self._sentence_splitter is not None:
+                self._sentences = self._sentence_splitter(self._doc.read())
+            else:
+                self._sentences = _punkt_sentence_tokenizer().tokenize(self._doc.read())
         return self._sentences
 
     @property
-    def sentence_words(self) -> List[List[str]]:
+    def sentence_words(self) -> List[List[str]] | Iterator[List[str]]:
         """
         Generates a list of sentences that are segmented into a list of words
         such that the ith index in the parent list corresponds to a list of
@@ -99,20 +214,25 @@ class DocumentMetrics:
             From a sequence of sentences: 'Sentence one.', 'sentence two', ...
             The following is generated: [['Sentence', 'one'], ['sentence', 'two'], ...]
 
-        :return: A list of segmented sentence words as strings
+        :return: A list of segmented sentence words as strings, or a fresh
+                 generator over them when streaming
         """
+        if self._streaming:
+            findall = self._token_pattern.findall
+            return (findall(sentence) for sentence in self.sentences)
         if self._sentence_words is None:
-            sw = [nltk.regexp_tokenize(sentence, self._token_pattern) for sentence in self.sentences]
+            findall = self._token_pattern.findall
+            sw = [findall(sentence) for sentence in self.sentences]
             self._sentence_words: List[List[str]] = sw
         return self._sentence_words
 
     @property
-    def word_sentences_map(self) -> Dict[str, List[int]]:
+    def word_sentences_map(self) -> Dict[str, array]:
         """
-        See _build_word_to_sentences_map for documentation.
+        See _compute_all for documentation.
         """
         if self._word_sentences_map is None:
-            self._word_sentences_map = self._build_word_to_sentences_map()
+            self._compute_all()
         return self._word_sentences_map
 
     @property
@@ -123,7 +243,9 @@ class DocumentMetrics:
         :return: A list of words that have not been modified.
         """
         if self._words is None:
-            self._words = self._flattened_sentence_words(normalize=False)
+            if self._streaming:
+                return list(chain.from_iterable(self.sentence_words))
+            self._compute_all()
         return self._words
 
     @property
@@ -134,7 +256,10 @@ class DocumentMetrics:
         :return: A list of lowercase words.
         """
         if self._words_normalized is None:
-            self._words_normalized = self._flattened_sentence_words(normalize=True)
+            lower = self._lc
+            if self._streaming:
+                return [lower(word) for word in self.words]
+            self._words_normalized = [lower(word) for word in self.words]
         return self._words_normalized
 
     @property
@@ -145,21 +270,23 @@ class DocumentMetrics:
         :return: Data structure containing word frequencies
         """
         if self._word_frequencies is None:
-            self._word_frequencies = Counter(self.words_normalized)
+            self._compute_all()
         return self._word_frequencies
 
-    def vocabulary(self, normalize: bool = True) -> Set[str]:
+    def vocabulary(self, normalize: bool = True) -> AbstractSet[str]:
         """
         Compiles all the words of interest in the current document with the option of
         normalization.
         :param normalize: If True then all compiled words are transformed to lowercase
-        :return: The set of words in the current document
+        :return: A read-only set view of the words in the current document
         """
-        if normalize and self._vocabulary_normalized is None:
-            self._vocabulary_normalized = set(self.words_normalized)
-        if not normalize and self._vocabulary is None:
-            self._vocabulary = set(self.words)
-        return self._vocabulary_normalized if normalize else self._vocabulary
+        if normalize:
+            # the frequency keys view is the normalized vocabulary, shared
+            # with the Counter at no copy cost
+            return self.word_frequencies.keys()
+        if self._raw_word_frequencies is None:
+            self._compute_all()
+        return self._raw_word_frequencies.keys()
 
     def word_frequency(self, word: str) -> int:
         """
@@ -180,38 +307,154 @@ class DocumentMetrics:
         sentence_indices = self.word_sentences_map.get(word.lower(), [])
         return [self.sentences[index] for index in sentence_indices]
 
-    def _build_word_to_sentences_map(self) -> Dict[str, List[int]]:
-        """
-        Build a data structure that maps normalized words of interest to
-        indices of sentences such that the corresponding sentences contain
-        at least one occurrence of a key word.
+    def _lc(self, word: str) -> str:
+        """
+        Lowercase a token through a per-document memo. Word distributions
+        are Zipfian, so the most frequent tokens would otherwise be lowered
+        thousands of times redundantly.
+        :param word: A token produced by the token pattern
+        :return: The lowercase form of the token
+        """
+        normalized = self._lower_cache.get(word)
+        if normalized is None:
+            normalized = self._lower_cache[word] = word.lower()
+        return normalized
+
+    def _cache_file(self) -> Path | None:
+        """
+        Resolve the on-disk cache location of this document's metrics. The
+        key covers the document path, its modification time, the token
+        pattern and the sentence splitter, so edited documents, a different
+        pattern or a different splitter miss the cache.
+        :return: The cache file path, or None when caching does not apply
+        """
+        if self._cache_dir is None:
+            return None
+        document_path = self._doc.path()
+        if document_path is None:
+            return None
+        try:
+            modified_time = os.path.getmtime(document_path)
+        except OSError:
+            return None
+        if self._sentence_splitter is None:
+            splitter_name = 'punkt'
+        else:
+            splitter_name = getattr(self._sentence_splitter, '__qualname__', repr(self._sentence_splitter))
+        key_material = f'{document_path}:{modified_time}:{self._token_pattern.pattern}:{splitter_name}'
+        key = hashlib.md5(key_material.encode('utf-8')).hexdigest()
+        return Path(self._cache_dir) / f'{key}.pkl'
+
+    def _load_cached_metrics(self) -> bool:
+        """
+        Restore previously computed metrics from the on-disk cache.
+        :return: True if the caches were populated from disk
+        """
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return False
+        try:
+            with open(cache_file, 'rb') as cache:
+                cached = pickle.load(cache)
+        except (OSError, pickle.PickleError, EOFError):
+            return False
+        try:
+            sentences = cached['sentences']
+            words = cached['words']
+            word_frequencies = cached['word_frequencies']
+            raw_word_frequencies = cached['raw_word_frequencies']
+            word_sentences_map = cached['word_sentences_map']
+        except KeyError:
+            # cache entry written by an older layout; recompute
+            return False
+        if words is None and not self._streaming:
+            # cache entry written by a streaming run carries no word list;
+            # recompute (and overwrite it with the complete payload)
+            return False
+        self._sentences = sentences
+        if words is not None:
+            self._words = words
+        self._word_frequencies = word_frequencies
+        self._raw_word_frequencies = raw_word_frequencies
+        self._word_sentences_map = word_sentences_map
+        return True
+
+    def _store_cached_metrics(self) -> None:
+        """
+        Persist the computed metrics to the on-disk cache; failures to write
+        are ignored since the cache is purely an optimization.
+        """
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return
+        cached = {
+            'sentences': self._sentences,
+            'words': self._words,
+            'word_frequencies': self._word_frequencies,
+            'raw_word_frequencies': self._raw_word_frequencies,
+            'word_sentences_map': self._word_sentences_map,
+        }
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'wb') as cache:
+                pickle.dump(cached, cache, pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+    def _compute_all(self) -> None:
+        """
+        Derive every token level metric in a single traversal of the
+        segmented sentences: the flattened word list, the word frequencies
+        and the word to sentence indices map. The metrics were previously
+        derived with one pass over the tokens each, which re-touched every
+        token several times. The lowercase word list is not materialized
+        here; most consumers only need the frequencies and the index, so
+        words_normalized builds its list on first access instead.
+
+        The word to sentence indices map relates normalized words of
+        interest to indices of sentences such that the corresponding
+        sentences contain at least one occurrence of a key word.
         Example:
             Suppose self.sentences = ['I know you.', 'You are great!', 'Look before you go...']
             Then this data structure would be built as follows:
-                {'i': {0},          # because 'I' is located in the first sentence only
-                 'know': {0},
-                 'you': {0, 1, 2},  # because 'you' is located in the first, second and third sentences
-                 'are': {1},
+                {'i': [0],          # because 'I' is located in the first sentence only
+                 'know': [0],
+                 'you': [0, 1, 2],  # because 'you' is located in the first, second and third sentences
+                 'are': [1],
                  ...}
-
-        :return: A dictionary that maps normalized words to sentence indices
         """
-        word_sentence_map = defaultdict(set)
+        if self._load_cached_metrics():
+            return
+        words: List[str] = []
+        word_sentence_map: Dict[str, List[int]] = {}
+        frequencies: Counter = Counter()
+        raw_frequencies: Counter = Counter()
+        # bind the loop-invariant lookups to locals; the interpreter otherwise
+        # re-resolves each attribute on every token of the corpus
+        streaming = self._streaming
+        append_word = words.append
+        map_setdefault = word_sentence_map.setdefault
+        lower = self._lc
         for sentence_index, sentence_words in enumerate(self.sentence_words):
             for sentence_word in sentence_words:
-                word_sentence_map[sentence_word.lower()].add(sentence_index)
-        return {word: sorted(indices) for word, indices in word_sentence_map.items()}
-
-    def _flattened_sentence_words(self, normalize: bool = True) -> List[str]:
-        """
-        The _sentence_words data structure is flattened into a single list of
-        words where the words are left in there original form or transformed
-        to lower case.
-        :param normalize: True will transform words to lower case
-        :return: A list of words as defined by the token pattern in the __init__ method
-        """
-        words = reduce(add, self.sentence_words, [])
-        return [word.lower() for word in words] if normalize else words
+                normalized_word = lower(sentence_word)
+                if not streaming:
+                    append_word(sentence_word)
+                frequencies[normalized_word] += 1
+                raw_frequencies[sentence_word] += 1
+                # sentence indices arrive in increasing order, so checking the
+                # last recorded index keeps the list sorted and deduplicated
+                sentence_indices = map_setdefault(normalized_word, [])
+                if not sentence_indices or sentence_indices[-1] != sentence_index:
+                    sentence_indices.append(sentence_index)
+        if not streaming:
+            self._words = words
+        self._word_frequencies = frequencies
+        self._raw_word_frequencies = raw_frequencies
+        # compact the index lists into int arrays: 4 bytes per element and
+        # contiguous, against ~28 bytes plus a pointer per Python int
+        self._word_sentences_map = {word: array('i', indices) for word, indices in word_sentence_map.items()}
+        self._store_cached_metrics()
 
 
 class DocumentsMetrics:
@@ -225,6 +468,12 @@ class DocumentsMetrics:
         self._word_frequencies: Counter | None = None
         self._word_documents_map: Dict[str, List[int]] | None = None
 
+        # memoize the public word lookups per instance; callers such as the
+        # controller probe the same small set of top words repeatedly
+        self.word_frequency = lru_cache(maxsize=None)(self.word_frequency)
+        self.document_names_containing_word = lru_cache(maxsize=None)(self.document_names_containing_word)
+        self.sentences_containing_word = lru_cache(maxsize=None)(self.sentences_containing_word)
+
     @property
     def word_frequencies(self) -> Counter:
         """
@@ -233,7 +482,10 @@ class DocumentsMetrics:
         :return: Data structure containing word frequencies
         """
         if self._word_frequencies is None:
-            self._word_frequencies = reduce(add, [dm.word_frequencies for dm in self._docs_metrics], Counter())
+            frequencies = Counter()
+            for doc_metrics in self._docs_metrics:
+                frequencies.update(doc_metrics.word_frequencies)
+            self._word_frequencies = frequencies
         return self._word_frequencies
 
     @property
@@ -280,7 +532,30 @@ class DocumentsMetrics:
         document_metrics_indices = self.word_document_map.get(word, [])
         documents_metrics = [self._docs_metrics[index] for index in document_metrics_indices]
         sentences = [doc_metrics.sentences_containing_word(word) for doc_metrics in documents_metrics]
-        return reduce(add, sentences, [])
+        return list(chain.from_iterable(sentences))
+
+    def per_word_documents_and_sentences(self, words: List[str]) -> Dict[str, Tuple[List[str], List[str]]]:
+        """
+        Batch form of document_names_containing_word and
+        sentences_containing_word: the answers for all the given words are
+        assembled in a single sweep over the documents instead of one scan
+        of the documents per word.
+        :param words: The words to search for in each document.
+        :return: A dictionary that maps each normalized word to its list of
+                 document names and its list of sentences
+        """
+        # deduplicate after normalizing, preserving order, so inputs that
+        # differ only in case do not double the collected results
+        normalized_words = list(dict.fromkeys(word.lower() for word in words))
+        result: Dict[str, Tuple[List[str], List[str]]] = {word: ([], []) for word in normalized_words}
+        for doc_metrics in self._docs_metrics:
+            word_sentences_map = doc_metrics.word_sentences_map
+            for word in normalized_words:
+                if word in word_sentences_map:
+                    document_names, sentences = result[word]
+                    document_names.append(doc_metrics.document_name)
+                    sentences.extend(doc_metrics.sentences_containing_word(word))
+        return result
 
     def most_common_words_filtered_by_length(self, length_interval: Tuple[int, int], n: int = None) -> List[Tuple[str, int]]:
         """
@@ -291,12 +566,12 @@ class DocumentsMetrics:
         :param n: At most these number of common words are returned
         :return: A list of word and frequency tuples sorted by frequency in descending order
         """
-        frequency_index = 1
         lower, upper = length_interval
-        vocabulary = self.word_frequencies.keys()
-        common = [(word, self.word_frequency(word)) for word in vocabulary if lower <= len(word) <= upper]
-        common.sort(key=lambda tup: tup[frequency_index], reverse=True)
-        return common if n is None else common[:n]
+        common = ((word, frequency) for word, frequency in self.word_frequencies.items()
+                  if lower <= len(word) <= upper)
+        if n is None:
+            return sorted(common, key=itemgetter(1), reverse=True)
+        return heapq.nlargest(n, common, key=itemgetter(1))
 
     def _build_word_to_document_map(self) -> Dict[str, List[int]]:
         """
@@ -312,8 +587,10 @@ class DocumentsMetrics:
 
         :return: A dictionary that maps normalized words to document indices
         """
-        word_document_sentences_map = defaultdict(set)
+        word_document_map: Dict[str, List[int]] = {}
         for document_index, document in enumerate(self._docs_metrics):
             for word in document.word_sentences_map.keys():
-                word_document_sentences_map[word].add(document_index)
-        return {word: sorted(indices) for word, indices in word_document_sentences_map.items()}
+                # document indices arrive in increasing order and each word
+                # occurs once per document, so appending keeps the list sorted
+                word_document_map.setdefault(word, []).append(document_index)
+        return word_document_map
@@ -1,10 +1,33 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from textwrap import wrap
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 
 from tabulate import tabulate
 
-from document_metrics import Document, DocumentMetrics, DocumentsMetrics
+from document_metrics import Document, DocumentMetrics, DocumentsMetrics, fast_sentence_split
+
+
+def _warmed_document_metrics(
+        file_path: Path,
+        sentence_splitter: Callable[[str], List[str]] | None = None,
+        cache_dir: Path | None = None
+) -> DocumentMetrics:
+    """
+    Build the metrics of a single document and force the expensive lazy
+    computations so they run inside the worker process and travel back
+    with the pickled instance.
+    :param file_path: A text file path
+    :param sentence_splitter: An optional sentence segmentation strategy
+    :param cache_dir: An optional directory for the persistent metrics cache
+    :return: A DocumentMetrics object with its caches populated
+    """
+    document_metrics = DocumentMetrics(
+        Document(file_path), streaming=True, sentence_splitter=sentence_splitter, cache_dir=cache_dir)
+    document_metrics.word_frequencies
+    document_metrics.word_sentences_map
+    return document_metrics
 
 
 class EigenCLIView:
@@ -59,22 +82,53 @@ class EigenController:
         return [file for file in file_paths if file.is_file() and file.suffix == '.txt']
 
     @staticmethod
-    def metrics(file_paths: List[Path]) -> DocumentsMetrics:
-        documents = [Document(file_path) for file_path in file_paths]
-        documents_metrics = [DocumentMetrics(document) for document in documents]
+    def metrics(
+            file_paths: List[Path],
+            max_workers: int | None = None,
+            sentence_splitter: Callable[[str], List[str]] | None = None,
+            cache_dir: Path | None = None
+    ) -> DocumentsMetrics:
+        """
+        Build the metrics of each document, tokenizing documents in parallel
+        across processes since the workload is CPU-bound and independent per
+        document.
+        :param file_paths: The text file paths to process
+        :param max_workers: Upper bound on worker processes; None lets the pool decide
+        :param sentence_splitter: An optional sentence segmentation strategy
+        :param cache_dir: An optional directory for the persistent metrics cache
+        :return: The aggregate metrics over all documents
+        """
+        warmed_metrics = partial(_warmed_document_metrics, sentence_splitter=sentence_splitter, cache_dir=cache_dir)
+        if len(file_paths) < 2:
+            documents_metrics = [warmed_metrics(file_path) for file_path in file_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                documents_metrics = list(executor.map(warmed_metrics, file_paths))
         return DocumentsMetrics(documents_metrics)
 
-    def run(self, word_length_interval: tuple[int, int], n_common_words: int, max_sentence_width):
+    def run(
+            self,
+            word_length_interval: tuple[int, int],
+            n_common_words: int,
+            max_sentence_width,
+            max_workers: int | None = None,
+            fast_sentences: bool = False,
+            cache: bool = True
+    ):
         file_paths = self.text_file_paths()
-        metrics = self.metrics(file_paths)
+        sentence_splitter = fast_sentence_split if fast_sentences else None
+        cache_dir = Path.home() / '.cache' / 'textprocessing' if cache else None
+        metrics = self.metrics(file_paths, max_workers, sentence_splitter, cache_dir)
         words_of_interest = metrics.most_common_words_filtered_by_length(word_length_interval, n_common_words)
+        word_details = metrics.per_word_documents_and_sentences([word for word, _ in words_of_interest])
 
         table = []
         table_headers = ['Word (Total Occurrences)', 'Documents', 'Sentences containing the word']
         for word, frequency in words_of_interest:
+            containing_documents, containing_sentences = word_details[word]
             word_occurrence = f'{word.capitalize()} ({frequency})'
-            document_names = '\n'.join(sorted(metrics.document_names_containing_word(word)))
-            sentences = '\n\n'.join(self._textwrap(sente, max_sentence_width) for sente in metrics.sentences_containing_word(word))
+            document_names = '\n'.join(sorted(containing_documents))
+            sentences = '\n\n'.join(self._textwrap(sente, max_sentence_width) for sente in containing_sentences)
             table.append((word_occurrence, document_names, sentences))
 
         EigenCLIView(word_length_interval, n_common_words, table, table_headers).display()
@@ -0,0 +1,38 @@
+import unittest
+from collections import Counter
+from pathlib import Path
+
+from src.document_metrics import DocumentMetrics
+from tests._fixtures import cached_metrics
+
+
+class TestDocumentMetricsBase(unittest.TestCase):
+    """
+    Shared base for the metrics test modules: one definition of the asset
+    path, the path helper and the cached fixture lookup instead of a copy
+    per file.
+    """
+    test_assets_path: Path = Path(__file__).parent / 'assets'
+
+    # fixture paths by document name, so repeated doc_path calls do not
+    # allocate a fresh Path each time
+    _doc_paths: dict = {}
+
+    @classmethod
+    def doc_path(cls, doc_name: str) -> Path:
+        path = cls._doc_paths.get(doc_name)
+        if path is None:
+            path = cls._doc_paths[doc_name] = cls.test_assets_path / doc_name
+        return path
+
+    @classmethod
+    def metrics_for(cls, doc_name: str) -> DocumentMetrics:
+        return cached_metrics(cls.doc_path(doc_name))
+
+    def assertMultisetEqual(self, expected, actual):
+        """
+        Compare two iterables as multisets, for results whose ordering is
+        not part of the API contract; pinning the order with assertEqual
+        would force the implementation onto ordered aggregation structures.
+        """
+        self.assertEqual(Counter(expected), Counter(actual))
@@ -0,0 +1,34 @@
+"""
+Shared, process-local fixture caches. Each pytest-xdist worker builds its
+own copies on first use and nothing here mutates global state, so the test
+classes can be distributed across processes (pytest -n auto) safely.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+from src.document_metrics import Document
+from src.document_metrics import DocumentMetrics
+
+
+@lru_cache(maxsize=None)
+def cached_text(path: Path) -> str:
+    """
+    Read a fixture file once per test process; every later request for the
+    same path is served from memory.
+    :param path: A fixture document path
+    :return: The document text
+    """
+    return path.read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=None)
+def cached_metrics(path: Path) -> DocumentMetrics:
+    """
+    Build the metrics of a fixture document once per test process. The same
+    fixture files back many independent test classes, and without this cache
+    each class re-parses identical text in its own setUpClass. The document
+    is fed from the in-memory text so the fixtures hit disk exactly once.
+    :param path: A fixture document path
+    :return: The shared DocumentMetrics object for the given path
+    """
+    return DocumentMetrics(Document.from_text(path.name, cached_text(path)))
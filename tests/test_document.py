@@ -6,12 +6,16 @@ from src.document_metrics import Document
 class TestDocument(unittest.TestCase):
     test_assets_path: Path = Path(__file__).parent / 'assets'
 
-    @staticmethod
-    def doc_path(doc_name: str):
-        return TestDocument.test_assets_path / doc_name
+    @classmethod
+    def setUpClass(cls) -> None:
+        # fixture paths built once for the class instead of a fresh Path
+        # allocation in every test
+        cls.empty_document_path = cls.test_assets_path / 'doc_empty.txt'
+        cls.multiple_lines_document_path = cls.test_assets_path / 'doc_multiple_lines.txt'
+        cls.bogus_document_path = cls.test_assets_path / 'bogus.txt'
 
     def test_entire_file_read(self):
-        document = Document(self.doc_path('doc_multiple_lines.txt'))
+        document = Document(self.multiple_lines_document_path)
         actual = document.read()
         expected = "Let me begin by saying thanks to all you who've traveled, from far and wide, to brave the cold today.\n" \
                    "We all made this journey for a reason. It's humbling, but in my heart I know you didn't come here just for " \
@@ -20,24 +24,23 @@ class TestDocument(unittest.TestCase):
         self.assertEqual(expected, actual)
 
     def test_empty_file_read(self):
-        document = Document(self.doc_path('doc_empty.txt'))
+        document = Document(self.empty_document_path)
         actual = document.read()
         expected = ""
         self.assertEqual(expected, actual)
 
     def test_file_does_not_exist(self):
-        document = Document(self.doc_path('bogus.txt'))
+        document = Document(self.bogus_document_path)
         actual = document.exists()
         self.assertFalse(actual)
 
     def test_file_does_exist(self):
-        document = Document(self.doc_path('doc_empty.txt'))
+        document = Document(self.empty_document_path)
         actual = document.exists()
         self.assertTrue(actual)
 
     def test_extraction_of_filename_from_document_path(self):
-        filename = 'doc_empty.txt'
-        document = Document(self.doc_path(filename))
+        document = Document(self.empty_document_path)
         actual = document.name()
-        expected = filename
+        expected = self.empty_document_path.name
         self.assertEqual(expected, actual)
